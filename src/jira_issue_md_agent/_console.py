@@ -0,0 +1,36 @@
+"""Shared Rich console, constructed lazily on first use.
+
+Creating ``rich.console.Console`` inspects stdout, detects the color
+system, and queries the terminal size. Doing that once for the whole
+process — and only when something actually prints — keeps module import
+cheap and avoids one console per module.
+"""
+
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+_console: Optional["Console"] = None
+
+
+def get_console() -> "Console":
+    """Return the process-wide Console, creating it on first call."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+class _ConsoleProxy:
+    """Import-time stand-in that defers Console construction to first use."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_console(), name)
+
+
+console = _ConsoleProxy()
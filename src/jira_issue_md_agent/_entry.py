@@ -0,0 +1,20 @@
+"""Console-script entrypoint with a fast path for `jira-md version`.
+
+Answering the version query needs none of typer/rich/httpx, so check
+argv before importing the CLI module and its dependency tree.
+"""
+
+import sys
+
+
+def run() -> None:
+    """Run the CLI, short-circuiting the bare version query."""
+    if len(sys.argv) == 2 and sys.argv[1] == "version":
+        from . import __version__
+
+        print(f"jira-issue-md-agent version {__version__}")
+        sys.exit(0)
+
+    from .cli import app
+
+    app()
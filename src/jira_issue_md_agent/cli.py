@@ -1,14 +1,14 @@
 """Command-line interface for Jira Issue MD Agent."""
 
 import re
+from dataclasses import replace
 from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
 
 from . import __version__
+from ._console import console, get_console
 from .config import Settings, load_settings
 from .issue_fetcher import IssueFetcher
 from .renderer import MarkdownRenderer
@@ -19,7 +19,24 @@ app = typer.Typer(
     help="Fetch Jira issues and convert to development-ready Markdown files",
     add_completion=False,
 )
-console = Console()
+
+# Pattern to match issue keys like JSAI-123, UEP-456, etc.
+# Matches: PROJECT-NUMBER format. Compiled over bytes so files can be
+# scanned without a decode pass (keys themselves are pure ASCII).
+_ISSUE_KEY_RE = re.compile(rb'\b([A-Z][A-Z0-9]+-\d+)\b')
+
+# Shared renderer so repeated fetch calls (library/test embedders) pay the
+# Jinja environment and template setup once
+_RENDERER: Optional[MarkdownRenderer] = None
+
+
+def _get_renderer() -> MarkdownRenderer:
+    """Return the shared MarkdownRenderer, creating it on first use."""
+    global _RENDERER
+    if _RENDERER is None:
+        _RENDERER = MarkdownRenderer()
+    return _RENDERER
+
 
 def _parse_issue_file(file_path: Path) -> list[str]:
     """Parse issue keys from a file.
@@ -35,23 +52,13 @@ def _parse_issue_file(file_path: Path) -> list[str]:
     Returns:
         List of issue keys found
     """
-    content = file_path.read_text(encoding="utf-8")
-    
-    # Pattern to match issue keys like JSAI-123, UEP-456, etc.
-    # Matches: PROJECT-NUMBER format
-    pattern = r'\b([A-Z][A-Z0-9]+-\d+)\b'
-    
-    matches = re.findall(pattern, content)
-    
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_keys = []
-    for key in matches:
-        if key not in seen:
-            seen.add(key)
-            unique_keys.append(key)
-    
-    return unique_keys
+    content = file_path.read_bytes()
+
+    # Single pass: finditer streams matches straight into the dedup dict
+    # (order-preserving), so no intermediate match list is built and each
+    # distinct key is decoded exactly once
+    unique_keys = dict.fromkeys(match[1] for match in _ISSUE_KEY_RE.finditer(content))
+    return [key.decode("ascii") for key in unique_keys]
 
 
 
@@ -131,6 +138,10 @@ def fetch(
         # Don't overwrite existing files
         jira-md fetch --jql "sprint = 42" --no-overwrite
     """
+    # Deferred so commands that never fetch don't pay for these imports
+    from rich.panel import Panel
+    from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+
     # Validate input
     if not key and not jql and not file:
         console.print("[red]Error:[/red] Must specify one of: --key, --jql, or --file")
@@ -147,77 +158,90 @@ def fetch(
         console.print("[cyan]Loading configuration...[/cyan]")
         settings = load_settings(env_file)
 
-        # Override output directory if specified
+        # Override output directory if specified — on a copy, since
+        # load_settings returns a cached instance shared across calls
         if out:
-            settings.output_dir = out
+            settings = replace(settings, output_dir=out)
 
         # Initialize components
-        fetcher = IssueFetcher(settings)
-        renderer = MarkdownRenderer()
+        renderer = _get_renderer()
         writer = MarkdownWriter(settings.output_dir, overwrite=not no_overwrite)
 
         # Fetch issues
         console.print("\n" + "=" * 60)
         
-        if key:
-            console.print(Panel(f"Fetching single issue: [bold]{key}[/bold]", expand=False))
-            issue = fetcher.fetch_single(key)
-            content = renderer.render(issue)
-            writer.write(issue, content)
-
-        elif file:
-            # Read issue keys from file
-            console.print(Panel(f"Reading issue keys from: [bold]{file}[/bold]", expand=False))
-            try:
-                issue_keys = _parse_issue_file(file)
-                if not issue_keys:
-                    console.print("[yellow]No issue keys found in file[/yellow]")
-                    raise typer.Exit(0)
+        with IssueFetcher(settings) as fetcher:
+            if key:
+                console.print(Panel(f"Fetching single issue: [bold]{key}[/bold]", expand=False))
+                issue = fetcher.fetch_single(key)
+                content = renderer.render(issue)
+                writer.write(issue, content)
+
+            elif file:
+                # Read issue keys from file
+                console.print(Panel(f"Reading issue keys from: [bold]{file}[/bold]", expand=False))
+                try:
+                    issue_keys = _parse_issue_file(file)
+                    # Group keys by project (then issue number) so bulk-fetch
+                    # chunks and the per-project markdown writes stay contiguous
+                    issue_keys.sort(key=lambda k: (k.split("-", 1)[0], int(k.split("-", 1)[1])))
+                    if not issue_keys:
+                        console.print("[yellow]No issue keys found in file[/yellow]")
+                        raise typer.Exit(0)
                 
-                console.print(f"[cyan]Found {len(issue_keys)} issue key(s)[/cyan]")
+                    console.print(f"[cyan]Found {len(issue_keys)} issue key(s)[/cyan]")
+
+                    # Fetch all issues via the bulkfetch endpoint over one client.
+                    # A single live progress bar replaces per-issue prints so the
+                    # terminal does O(1) redraws instead of O(N) renders.
+                    with Progress(
+                        SpinnerColumn(),
+                        TextColumn("[progress.description]{task.description}"),
+                        BarColumn(),
+                        MofNCompleteColumn(),
+                        console=get_console(),
+                    ) as progress:
+                        task = progress.add_task("Fetching", total=len(issue_keys))
+
+                        def _on_progress(fetched_key: str) -> None:
+                            progress.update(task, advance=1, description=fetched_key)
+
+                        issues = fetcher.fetch_many_bulk(issue_keys, on_progress=_on_progress)
+
+                    if not issues:
+                        console.print("[yellow]No issues were successfully fetched[/yellow]")
+                        raise typer.Exit(1)
                 
-                # Fetch all issues
-                issues = []
-                for idx, issue_key in enumerate(issue_keys, 1):
-                    try:
-                        console.print(f"\n[cyan]Fetching {idx}/{len(issue_keys)}:[/cyan] {issue_key}")
-                        issue = fetcher.fetch_single(issue_key)
-                        issues.append(issue)
-                    except Exception as e:
-                        console.print(f"[red]✗[/red] Failed to fetch {issue_key}: {e}")
+                    # Render and write all issues; the generator lets each
+                    # rendered document be written and released immediately
+                    console.print(f"\n[cyan]Rendering {len(issues)} issue(s)...[/cyan]")
+                    issues_with_content = ((issue, renderer.render(issue)) for issue in issues)
+                    written_paths = writer.write_batch(issues_with_content)
                 
-                if not issues:
-                    console.print("[yellow]No issues were successfully fetched[/yellow]")
-                    raise typer.Exit(1)
+                    console.print(f"\n[bold green]✓ Successfully written {len(written_paths)} file(s)[/bold green]")
                 
-                # Render and write all issues
-                console.print(f"\n[cyan]Rendering {len(issues)} issue(s)...[/cyan]")
-                issues_with_content = [(issue, renderer.render(issue)) for issue in issues]
-                written_paths = writer.write_batch(issues_with_content)
-                
-                console.print(f"\n[bold green]✓ Successfully written {len(written_paths)} file(s)[/bold green]")
-                
-            except FileNotFoundError:
-                console.print(f"[red]Error:[/red] File not found: {file}")
-                raise typer.Exit(1)
-            except Exception as e:
-                console.print(f"[red]Error:[/red] Failed to read file: {e}")
-                raise typer.Exit(1)
+                except FileNotFoundError:
+                    console.print(f"[red]Error:[/red] File not found: {file}")
+                    raise typer.Exit(1)
+                except Exception as e:
+                    console.print(f"[red]Error:[/red] Failed to read file: {e}")
+                    raise typer.Exit(1)
 
-        elif jql:
-            console.print(Panel(f"Fetching issues with JQL:\n[bold]{jql}[/bold]", expand=False))
-            issues = fetcher.fetch_batch(jql, limit=limit)
+            elif jql:
+                console.print(Panel(f"Fetching issues with JQL:\n[bold]{jql}[/bold]", expand=False))
+                issues = fetcher.fetch_batch(jql, limit=limit)
 
-            if not issues:
-                console.print("[yellow]No issues found matching the JQL query[/yellow]")
-                raise typer.Exit(0)
+                if not issues:
+                    console.print("[yellow]No issues found matching the JQL query[/yellow]")
+                    raise typer.Exit(0)
 
-            # Render and write all issues
-            console.print(f"\n[cyan]Rendering {len(issues)} issue(s)...[/cyan]")
-            issues_with_content = [(issue, renderer.render(issue)) for issue in issues]
-            written_paths = writer.write_batch(issues_with_content)
+                # Render and write all issues; the generator lets each
+                # rendered document be written and released immediately
+                console.print(f"\n[cyan]Rendering {len(issues)} issue(s)...[/cyan]")
+                issues_with_content = ((issue, renderer.render(issue)) for issue in issues)
+                written_paths = writer.write_batch(issues_with_content)
 
-            console.print(f"\n[bold green]✓ Successfully written {len(written_paths)} file(s)[/bold green]")
+                console.print(f"\n[bold green]✓ Successfully written {len(written_paths)} file(s)[/bold green]")
 
         console.print("=" * 60)
         console.print(f"\n[bold green]Done![/bold green] Output directory: {settings.output_dir}")
@@ -237,4 +261,6 @@ def fetch(
 
 
 if __name__ == "__main__":
-    app()
+    from ._entry import run
+
+    run()
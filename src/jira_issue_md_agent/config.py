@@ -1,37 +1,74 @@
 """Configuration management for Jira Issue MD Agent."""
 
+import functools
+import os
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
 
+@dataclass(slots=True)
+class Settings:
+    """Application settings loaded from environment variables.
 
-class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
+    A plain dataclass: the four known keys need no validator machinery,
+    and skipping the pydantic-settings import keeps CLI startup cheap.
+    """
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
-
-    jira_base_url: str = Field(
-        ...,
-        description="Jira base URL (e.g., https://your-domain.atlassian.net)",
-    )
-    jira_email: str = Field(..., description="Jira user email for authentication")
-    jira_api_token: str = Field(..., description="Jira API token for authentication")
-    output_dir: Path = Field(default=Path("outputs"), description="Output directory for markdown files")
+    jira_base_url: str  # Jira base URL (e.g., https://your-domain.atlassian.net)
+    jira_email: str  # Jira user email for authentication
+    jira_api_token: str  # Jira API token for authentication
+    output_dir: Path = Path("outputs")  # Output directory for markdown files
 
     def get_jira_auth(self) -> tuple[str, str]:
         """Return authentication tuple for httpx basic auth."""
         return (self.jira_email, self.jira_api_token)
 
 
+def _load_env_file(env_file: Path) -> dict[str, str]:
+    """Parse KEY=VALUE lines from a .env file.
+
+    Blank lines and #-comments are skipped; surrounding quotes on values
+    are stripped. The result stays local — os.environ is never written,
+    so loading a different env file later sees that file's values rather
+    than whatever a previous load left in the process environment.
+    """
+    values: dict[str, str] = {}
+    for line in env_file.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, _, value = line.partition("=")
+        values[key.strip().upper()] = value.strip().strip("'\"")
+    return values
+
+
+def _require(env: dict[str, str], name: str) -> str:
+    """Read a required setting from the merged mapping or fail clearly."""
+    value = env.get(name)
+    if not value:
+        raise ValueError(f"Missing required setting: {name} (set it in .env or the environment)")
+    return value
+
+
+@functools.lru_cache(maxsize=8)
 def load_settings(env_file: Optional[Path] = None) -> Settings:
-    """Load settings from environment or specified .env file."""
-    if env_file:
-        return Settings(_env_file=str(env_file))
-    return Settings()
+    """Load settings from environment or specified .env file.
+
+    Cached per env_file so repeated calls (tests, library embedders) skip
+    re-parsing the .env file. Real environment variables override the
+    file's values, matching the old pydantic-settings precedence.
+    """
+    path = env_file or Path(".env")
+    if env_file and not path.exists():
+        raise FileNotFoundError(path)
+
+    env = _load_env_file(path) if path.exists() else {}
+    env.update(os.environ)
+
+    return Settings(
+        jira_base_url=_require(env, "JIRA_BASE_URL"),
+        jira_email=_require(env, "JIRA_EMAIL"),
+        jira_api_token=_require(env, "JIRA_API_TOKEN"),
+        output_dir=Path(env.get("OUTPUT_DIR", "outputs")),
+    )
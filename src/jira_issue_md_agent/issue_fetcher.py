@@ -1,19 +1,23 @@
 """Issue fetching orchestration."""
 
-from typing import Optional
-
-from rich.console import Console
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from typing import Callable, Optional
 
+from ._console import console
 from .config import Settings
 from .jira_client import JiraClient
 from .models import NormalizedIssue
-from .normalizer import IssueNormalizer
-
-console = Console()
+from .normalizer import IssueNormalizer, JiraContext
 
 
 class IssueFetcher:
-    """Orchestrate fetching and normalizing Jira issues."""
+    """Orchestrate fetching and normalizing Jira issues.
+
+    Can be used as a context manager, in which case a single JiraClient
+    (one TCP/TLS handshake, one warm connection pool) is shared by every
+    fetch call made inside the block.
+    """
 
     def __init__(self, settings: Settings):
         """Initialize issue fetcher.
@@ -23,6 +27,28 @@ class IssueFetcher:
         """
         self.settings = settings
         self.normalizer = IssueNormalizer()
+        # Built once per fetcher: every normalize call reuses the same
+        # precomputed browse prefix instead of re-deriving it per issue
+        self._ctx = JiraContext.from_base_url(settings.jira_base_url)
+        self._client: Optional[JiraClient] = None
+
+    def __enter__(self):
+        """Open a persistent JiraClient reused by all fetch calls."""
+        self._client = JiraClient(self.settings)
+        self._client.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close the persistent client."""
+        if self._client:
+            self._client.__exit__(exc_type, exc_val, exc_tb)
+            self._client = None
+
+    def _client_scope(self):
+        """Reuse the persistent client when open, else make a one-shot one."""
+        if self._client is not None:
+            return nullcontext(self._client)
+        return JiraClient(self.settings)
 
     def fetch_single(self, issue_key: str) -> NormalizedIssue:
         """Fetch and normalize a single issue.
@@ -36,14 +62,119 @@ class IssueFetcher:
         Raises:
             httpx.HTTPStatusError: If API request fails
         """
-        with JiraClient(self.settings) as client:
+        with self._client_scope() as client:
             fields = client.get_default_fields()
             issue_data = client.get_issue(issue_key, fields)
-            normalized = self.normalizer.normalize(issue_data, self.settings.jira_base_url)
+            normalized = self.normalizer.normalize(issue_data, self._ctx)
 
             console.print(f"[green]✓[/green] Fetched: {normalized.key} - {normalized.summary}")
             return normalized
 
+    def fetch_many(
+        self,
+        issue_keys: list[str],
+        concurrency: int = 8,
+        on_progress: Optional[Callable[[str], None]] = None,
+    ) -> list[NormalizedIssue]:
+        """Fetch and normalize multiple issues by key concurrently.
+
+        All requests share a single JiraClient so TCP/TLS setup is paid once
+        and httpx's connection pool is reused across keys.
+
+        Args:
+            issue_keys: Issue keys to fetch (e.g., ["UEP-123", "UEP-124"])
+            concurrency: Maximum number of in-flight requests
+            on_progress: Optional callback invoked with each completed key;
+                when given, the per-issue success prints are suppressed
+
+        Returns:
+            List of normalized issues in input-key order (failed keys are skipped)
+        """
+        if not issue_keys:
+            return []
+
+        with self._client_scope() as client:
+            fields = client.get_default_fields()
+
+            def _fetch_one(key: str) -> NormalizedIssue:
+                issue_data = client.get_issue(key, fields)
+                return self.normalizer.normalize(issue_data, self._ctx)
+
+            results: dict[str, NormalizedIssue] = {}
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(issue_keys))) as executor:
+                futures = {executor.submit(_fetch_one, key): key for key in issue_keys}
+                for future in as_completed(futures):
+                    key = futures[future]
+                    error = future.exception()
+                    if error:
+                        console.print(f"✗ Failed to fetch {key}: {error}", markup=False, highlight=False)
+                        continue
+                    normalized = future.result()
+                    results[key] = normalized
+                    if on_progress:
+                        on_progress(key)
+                    else:
+                        console.print(
+                            f"✓ Fetched: {normalized.key} - {normalized.summary}",
+                            markup=False,
+                            highlight=False,
+                        )
+
+        return [results[key] for key in issue_keys if key in results]
+
+    def fetch_many_bulk(
+        self,
+        issue_keys: list[str],
+        on_progress: Optional[Callable[[str], None]] = None,
+    ) -> list[NormalizedIssue]:
+        """Fetch and normalize issues by key via the bulkfetch endpoint.
+
+        N keys cost ceil(N/100) POSTs instead of N GETs. Keys absent from
+        the bulk response (e.g., stale references in the input file) are
+        retried with individual GETs before being reported as failed.
+
+        Args:
+            issue_keys: Issue keys to fetch (e.g., ["UEP-123", "UEP-124"])
+            on_progress: Optional callback invoked with each completed key
+
+        Returns:
+            List of normalized issues in input-key order (failed keys are skipped)
+        """
+        if not issue_keys:
+            return []
+
+        results: dict[str, NormalizedIssue] = {}
+        returned: set[str] = set()
+        with self._client_scope() as client:
+            fields = client.get_default_fields()
+
+            for issue_data in client.bulk_fetch_issues(issue_keys, fields):
+                key = issue_data.get("key", "UNKNOWN")
+                returned.add(key)
+                try:
+                    results[key] = self.normalizer.normalize(issue_data, self._ctx)
+                except Exception as e:
+                    console.print(f"⚠ Failed to normalize {key}: {e}", markup=False, highlight=False)
+                if on_progress:
+                    on_progress(key)
+
+            # Retry only keys the bulk response did not include; keys whose
+            # normalization failed above already have the data in hand, so
+            # re-fetching them would just repeat the failure (and double up
+            # on_progress for the same key)
+            for key in issue_keys:
+                if key in returned:
+                    continue
+                try:
+                    issue_data = client.get_issue(key, fields)
+                    results[key] = self.normalizer.normalize(issue_data, self._ctx)
+                    if on_progress:
+                        on_progress(key)
+                except Exception as e:
+                    console.print(f"✗ Failed to fetch {key}: {e}", markup=False, highlight=False)
+
+        return [results[key] for key in issue_keys if key in results]
+
     def fetch_batch(
         self,
         jql: str,
@@ -63,7 +194,7 @@ class IssueFetcher:
         Raises:
             httpx.HTTPStatusError: If API request fails
         """
-        with JiraClient(self.settings) as client:
+        with self._client_scope() as client:
             fields = client.get_default_fields()
             
             # If limit is specified and smaller than batch_size, adjust batch_size
@@ -75,16 +206,11 @@ class IssueFetcher:
             normalized_issues = []
             for issue_data in issues_data:
                 try:
-                    normalized = self.normalizer.normalize(
-                        issue_data, self.settings.jira_base_url
-                    )
+                    normalized = self.normalizer.normalize(issue_data, self._ctx)
                     normalized_issues.append(normalized)
-                    console.print(
-                        f"[green]✓[/green] Normalized: {normalized.key} - {normalized.summary}"
-                    )
                 except Exception as e:
                     key = issue_data.get("key", "UNKNOWN")
-                    console.print(f"[yellow]⚠[/yellow] Failed to normalize {key}: {e}")
+                    console.print(f"⚠ Failed to normalize {key}: {e}", markup=False, highlight=False)
 
             console.print(f"\n[bold green]Total issues fetched: {len(normalized_issues)}[/bold green]")
             return normalized_issues
@@ -3,11 +3,35 @@
 from typing import Any, Optional
 
 import httpx
-from rich.console import Console
+import orjson
 
+from ._console import console
 from .config import Settings
 
-console = Console()
+# Default fields to fetch from Jira, precomputed once with their joined CSV
+# form so per-issue fetches skip the list allocation and join
+_DEFAULT_FIELDS = (
+    "summary",
+    "description",
+    "status",
+    "priority",
+    "assignee",
+    "reporter",
+    "labels",
+    "components",
+    "fixVersions",
+    "created",
+    "updated",
+    "issuetype",
+    "parent",
+    "subtasks",
+    "issuelinks",
+    "project",
+)
+_DEFAULT_FIELDS_CSV = ",".join(_DEFAULT_FIELDS)
+
+# Jira Cloud caps bulkfetch requests at ~100 issue keys per call
+_BULK_FETCH_CHUNK = 100
 
 
 class JiraClient:
@@ -27,9 +51,17 @@ class JiraClient:
 
     def __enter__(self):
         """Context manager entry."""
+        # HTTP/2 lets concurrent issue GETs multiplex on one TCP/TLS connection;
+        # keepalive limits size the pool for the batch/file fetch paths.
         self._client = httpx.Client(
             auth=self.auth,
             timeout=self.timeout,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=16,
+                keepalive_expiry=30.0,
+            ),
             headers={"Accept": "application/json", "Content-Type": "application/json"},
         )
         return self
@@ -39,7 +71,7 @@ class JiraClient:
         if self._client:
             self._client.close()
 
-    def get_issue(self, issue_key: str, fields: Optional[list[str]] = None) -> dict[str, Any]:
+    def get_issue(self, issue_key: str, fields: Optional[tuple[str, ...]] = None) -> dict[str, Any]:
         """Fetch a single issue by key.
 
         Args:
@@ -55,23 +87,66 @@ class JiraClient:
         if not self._client:
             raise RuntimeError("Client not initialized. Use context manager.")
 
-        url = f"{self.base_url}/rest/api/3/issue/{issue_key}"
-        params = {}
-        if fields:
-            params["fields"] = ",".join(fields)
-
-        console.print(f"[cyan]Fetching issue:[/cyan] {issue_key}")
-        response = self._client.get(url, params=params)
+        if fields is _DEFAULT_FIELDS:
+            # Fast path for the common default-fields fetch: the full URL is
+            # known up front (issue keys are URL-safe by construction), so
+            # skip the params dict and httpx's query encoding entirely
+            response = self._client.get(
+                f"{self.base_url}/rest/api/3/issue/{issue_key}?fields={_DEFAULT_FIELDS_CSV}"
+            )
+        else:
+            url = f"{self.base_url}/rest/api/3/issue/{issue_key}"
+            params = {"fields": ",".join(fields)} if fields else None
+            response = self._client.get(url, params=params)
         response.raise_for_status()
 
-        return response.json()
+        # orjson decodes the large issue payloads much faster than stdlib json
+        return orjson.loads(response.content)
+
+    def bulk_fetch_issues(
+        self,
+        issue_keys: list[str],
+        fields: Optional[tuple[str, ...]] = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch multiple issues by key via the bulkfetch endpoint.
+
+        Collapses N per-key GETs into ceil(N/100) POSTs against
+        POST /rest/api/3/issue/bulkfetch.
+
+        Args:
+            issue_keys: Issue keys to fetch
+            fields: Optional list of fields to retrieve
+
+        Returns:
+            List of raw issue dictionaries (keys Jira could not resolve are
+            simply absent from the result)
+
+        Raises:
+            httpx.HTTPStatusError: If API request fails
+        """
+        if not self._client:
+            raise RuntimeError("Client not initialized. Use context manager.")
+
+        url = f"{self.base_url}/rest/api/3/issue/bulkfetch"
+        issues: list[dict[str, Any]] = []
+
+        for start in range(0, len(issue_keys), _BULK_FETCH_CHUNK):
+            payload: dict[str, Any] = {"issueIdsOrKeys": issue_keys[start : start + _BULK_FETCH_CHUNK]}
+            if fields:
+                payload["fields"] = fields
+
+            response = self._client.post(url, content=orjson.dumps(payload))
+            response.raise_for_status()
+            issues.extend(orjson.loads(response.content).get("issues", []))
+
+        return issues
 
     def search_issues(
         self,
         jql: str,
-        fields: Optional[list[str]] = None,
+        fields: Optional[tuple[str, ...]] = None,
         max_results: int = 50,
-        start_at: int = 0,
+        next_page_token: Optional[str] = None,
     ) -> dict[str, Any]:
         """Search issues using JQL.
 
@@ -79,10 +154,10 @@ class JiraClient:
             jql: JQL query string
             fields: Optional list of fields to retrieve
             max_results: Maximum results per page
-            start_at: Starting index for pagination
+            next_page_token: Pagination cursor from the previous response
 
         Returns:
-            Search response with issues
+            Search response with issues (and nextPageToken if more pages exist)
 
         Raises:
             httpx.HTTPStatusError: If API request fails
@@ -96,20 +171,21 @@ class JiraClient:
             "jql": jql,
             "maxResults": max_results,
         }
-        
-        # Only add startAt if not 0
-        if start_at > 0:
-            payload["startAt"] = start_at
-        
+
+        # The v3 /search/jql endpoint paginates with token cursors, not startAt
+        if next_page_token:
+            payload["nextPageToken"] = next_page_token
+
         # Add fields if specified (as array)
         if fields:
             payload["fields"] = fields
         
         console.print(f"[cyan]Searching with JQL:[/cyan] {jql}")
         try:
-            response = self._client.post(url, json=payload)
+            # Encode/decode with orjson instead of httpx's stdlib-json path
+            response = self._client.post(url, content=orjson.dumps(payload))
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except httpx.HTTPStatusError as e:
             # Print detailed error for debugging
             console.print(f"[red]Error:[/red] {e}")
@@ -120,7 +196,7 @@ class JiraClient:
     def search_all_issues(
         self,
         jql: str,
-        fields: Optional[list[str]] = None,
+        fields: Optional[tuple[str, ...]] = None,
         batch_size: int = 50,
         limit: Optional[int] = None,
     ) -> list[dict[str, Any]]:
@@ -139,7 +215,7 @@ class JiraClient:
             httpx.HTTPStatusError: If API request fails
         """
         all_issues = []
-        start_at = 0
+        next_token: Optional[str] = None
 
         while True:
             # If limit is set, don't fetch more than needed
@@ -149,53 +225,34 @@ class JiraClient:
                 if remaining <= 0:
                     break
                 current_batch_size = min(batch_size, remaining)
-            
-            response = self.search_issues(jql, fields, current_batch_size, start_at)
+
+            response = self.search_issues(jql, fields, current_batch_size, next_token)
             issues = response.get("issues", [])
-            
+
             # Break if no more issues returned
             if not issues:
                 break
-                
-            all_issues.extend(issues)
 
-            total = response.get("total", len(issues))  # Fallback to current count if total not provided
-            fetched = len(all_issues)
+            all_issues.extend(issues)
 
-            console.print(f"[green]Fetched {fetched} issues (limit: {limit or 'none'})[/green]")
+            console.print(f"[green]Fetched {len(all_issues)} issues (limit: {limit or 'none'})[/green]")
 
             # Stop if reached the limit
-            if limit and fetched >= limit:
+            if limit and len(all_issues) >= limit:
                 break
 
-            # Note: This API endpoint may not support pagination with startAt
-            # If you need more than 50 results, increase maxResults parameter
-            break
+            # Follow the token cursor; absence means this was the last page
+            next_token = response.get("nextPageToken")
+            if not next_token:
+                break
 
         return all_issues
 
     @staticmethod
-    def get_default_fields() -> list[str]:
+    def get_default_fields() -> tuple[str, ...]:
         """Get default fields to fetch from Jira API.
 
         Returns:
-            List of field names
+            Tuple of field names (shared module-level constant)
         """
-        return [
-            "summary",
-            "description",
-            "status",
-            "priority",
-            "assignee",
-            "reporter",
-            "labels",
-            "components",
-            "fixVersions",
-            "created",
-            "updated",
-            "issuetype",
-            "parent",
-            "subtasks",
-            "issuelinks",
-            "project",
-        ]
+        return _DEFAULT_FIELDS
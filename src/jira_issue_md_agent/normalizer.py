@@ -1,205 +1,270 @@
 """Normalize Jira API responses into consistent data structures."""
 
+import io
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional
 
 from .models import NormalizedIssue
 
+# Sentinel node popped after a paragraph's children so the newline is
+# emitted post-order, matching the recursive traversal it replaced
+_PARAGRAPH_END = {"type": "_paragraph_end"}
 
-class IssueNormalizer:
-    """Convert Jira API responses to NormalizedIssue format."""
-
-    @staticmethod
-    def normalize(issue_data: dict[str, Any], base_url: str) -> NormalizedIssue:
-        """Normalize a Jira issue response.
-
-        Args:
-            issue_data: Raw issue data from Jira API
-            base_url: Jira base URL for constructing issue links
-
-        Returns:
-            Normalized issue object
-        """
-        key = issue_data.get("key", "UNKNOWN")
-        fields = issue_data.get("fields", {})
-
-        # Extract basic fields
-        summary = fields.get("summary", "No Summary")
-        project = fields.get("project", {})
-        project_key = project.get("key", key.split("-")[0] if "-" in key else "UNKNOWN")
-
-        # Issue type
-        issuetype = fields.get("issuetype", {})
-        issue_type = issuetype.get("name", "Task")
-
-        # Status
-        status_obj = fields.get("status", {})
-        status = status_obj.get("name", "Unknown")
-
-        # Priority
-        priority_obj = fields.get("priority", {})
-        priority = priority_obj.get("name", "None") if priority_obj else "None"
-
-        # Assignee
-        assignee_obj = fields.get("assignee")
-        assignee = (
-            assignee_obj.get("displayName", assignee_obj.get("emailAddress", "Unassigned"))
-            if assignee_obj
-            else "Unassigned"
-        )
-
-        # Reporter
-        reporter_obj = fields.get("reporter")
-        reporter = (
-            reporter_obj.get("displayName", reporter_obj.get("emailAddress", "Unknown"))
-            if reporter_obj
-            else "Unknown"
-        )
-
-        # Labels
-        labels = fields.get("labels", [])
-
-        # Components
-        components_list = fields.get("components", [])
-        components = [comp.get("name", "") for comp in components_list if comp.get("name")]
-
-        # Timestamps
-        created = fields.get("created", "")
-        updated = fields.get("updated", "")
-        created_at = IssueNormalizer._format_datetime(created)
-        updated_at = IssueNormalizer._format_datetime(updated)
-
-        # Description (handle Atlassian Document Format)
-        description_raw = fields.get("description")
-        description_text = IssueNormalizer._extract_description_text(description_raw)
-
-        # Issue links
-        issue_links = fields.get("issuelinks", [])
-        links = IssueNormalizer._extract_links(issue_links, base_url)
-
-        # Construct URL
-        url = f"{base_url.rstrip('/')}/browse/{key}"
-
-        return NormalizedIssue(
-            key=key,
-            url=url,
-            project_key=project_key,
-            type=issue_type,
-            summary=summary,
-            status=status,
-            priority=priority,
-            assignee=assignee,
-            reporter=reporter,
-            labels=labels,
-            components=components,
-            created_at=created_at,
-            updated_at=updated_at,
-            description_text=description_text,
-            acceptance_criteria="",  # TODO: Extract from description if pattern found
-            dev_notes="",
-            links=links,
-        )
-
-    @staticmethod
-    def _format_datetime(dt_string: str) -> str:
-        """Format ISO datetime string to readable format.
-
-        Args:
-            dt_string: ISO format datetime string
-
-        Returns:
-            Formatted datetime string
-        """
-        if not dt_string:
-            return "Unknown"
-
-        try:
-            dt = datetime.fromisoformat(dt_string.replace("Z", "+00:00"))
-            return dt.strftime("%Y-%m-%d %H:%M:%S")
-        except (ValueError, AttributeError):
-            return dt_string
-
-    @staticmethod
-    def _extract_description_text(description: Any) -> str:
-        """Extract plain text from Jira description (handles Atlassian Document Format).
 
-        Args:
-            description: Description field from Jira (can be dict, str, or None)
-
-        Returns:
-            Plain text description
-        """
-        if not description:
-            return ""
+@dataclass(frozen=True, slots=True)
+class JiraContext:
+    """Per-run constants precomputed once for the normalization pipeline."""
 
-        # If it's already a string, return it
-        if isinstance(description, str):
-            return description
+    browse_prefix: str
 
-        # Handle Atlassian Document Format (ADF)
-        if isinstance(description, dict):
-            return IssueNormalizer._parse_adf(description)
-
-        return str(description)
-
-    @staticmethod
-    def _parse_adf(adf_doc: dict[str, Any]) -> str:
-        """Parse Atlassian Document Format to plain text.
+    @classmethod
+    def from_base_url(cls, base_url: str) -> "JiraContext":
+        """Build a context from the configured Jira base URL.
 
         Args:
-            adf_doc: ADF document structure
+            base_url: Jira base URL (trailing slash optional)
 
         Returns:
-            Plain text extracted from ADF
+            Context with the issue browse prefix precomputed, so per-issue
+            normalization concatenates instead of re-stripping and
+            re-formatting the URL
         """
-        text_parts = []
-
-        def extract_text(node: dict[str, Any]) -> None:
-            """Recursively extract text from ADF nodes."""
-            node_type = node.get("type", "")
+        return cls(browse_prefix=f"{base_url.rstrip('/')}/browse/")
+
+
+def normalize_issue(issue_data: dict[str, Any], ctx: JiraContext) -> NormalizedIssue:
+    """Normalize a Jira issue response.
+
+    Args:
+        issue_data: Raw issue data from Jira API
+        ctx: Per-run context carrying the precomputed browse prefix
+
+    Returns:
+        Normalized issue object
+    """
+    key = issue_data.get("key", "UNKNOWN")
+    fields = issue_data.get("fields", {})
+
+    # Extract basic fields
+    summary = fields.get("summary", "No Summary")
+    project = fields.get("project", {})
+    project_key = project.get("key", key.split("-")[0] if "-" in key else "UNKNOWN")
+
+    # Issue type
+    issuetype = fields.get("issuetype", {})
+    issue_type = issuetype.get("name", "Task")
+
+    # Status
+    status_obj = fields.get("status", {})
+    status = status_obj.get("name", "Unknown")
+
+    # Priority
+    priority_obj = fields.get("priority", {})
+    priority = priority_obj.get("name", "None") if priority_obj else "None"
+
+    # Assignee / reporter
+    assignee = _pick_name(fields.get("assignee"), "Unassigned")
+    reporter = _pick_name(fields.get("reporter"), "Unknown")
+
+    # Labels
+    labels = fields.get("labels", [])
+
+    # Components (one name lookup per entry; the filtering
+    # comprehension called .get twice per component)
+    components = []
+    for comp in fields.get("components", []):
+        name = comp.get("name")
+        if name:
+            components.append(name)
+
+    # Timestamps
+    created_at = _format_datetime(fields.get("created", ""))
+    updated_at = _format_datetime(fields.get("updated", ""))
+
+    # Description (handle Atlassian Document Format)
+    description_text = _extract_description_text(fields.get("description"))
+
+    # Issue links
+    links = _extract_links(fields.get("issuelinks", []), ctx)
+
+    # Construct URL
+    url = ctx.browse_prefix + key
+
+    # msgspec.Struct construction is validation-free already
+    return NormalizedIssue(
+        key=key,
+        url=url,
+        project_key=project_key,
+        type=issue_type,
+        summary=summary,
+        status=status,
+        priority=priority,
+        assignee=assignee,
+        reporter=reporter,
+        labels=labels,
+        components=components,
+        created_at=created_at,
+        updated_at=updated_at,
+        description_text=description_text,
+        acceptance_criteria="",  # TODO: Extract from description if pattern found
+        dev_notes="",
+        links=links,
+    )
+
+
+def _pick_name(user_obj: Optional[dict[str, Any]], default: str) -> str:
+    """Pick a display name from a Jira user object.
+
+    Args:
+        user_obj: User object from Jira (may be None)
+        default: Fallback when the object or both name fields are missing
+
+    Returns:
+        Display name, email address, or the default
+    """
+    # displayName is present on virtually every payload, so check it
+    # first and only fall back to emailAddress when it is absent — the
+    # old nested .get() evaluated the fallback lookup unconditionally
+    if not user_obj:
+        return default
+    name = user_obj.get("displayName")
+    if name:
+        return name
+    name = user_obj.get("emailAddress")
+    return name if name else default
+
+
+def _format_datetime(dt_string: str) -> str:
+    """Format ISO datetime string to readable format.
+
+    Args:
+        dt_string: ISO format datetime string
+
+    Returns:
+        Formatted datetime string
+    """
+    if not dt_string or len(dt_string) < 19:
+        return dt_string or "Unknown"
+
+    # Jira emits fixed-layout ISO 8601 (YYYY-MM-DDTHH:MM:SS.sss+ZZZZ),
+    # so the common case is two slices — no datetime object at all
+    if dt_string[10] == "T":
+        return f"{dt_string[:10]} {dt_string[11:19]}"
+
+    try:
+        dt = datetime.fromisoformat(dt_string.replace("Z", "+00:00"))
+        return dt.strftime("%Y-%m-%d %H:%M:%S")
+    except (ValueError, AttributeError):
+        return dt_string
+
+
+def _extract_description_text(description: Any) -> str:
+    """Extract plain text from Jira description (handles Atlassian Document Format).
+
+    Args:
+        description: Description field from Jira (can be dict, str, or None)
+
+    Returns:
+        Plain text description
+    """
+    if not description:
+        return ""
+
+    # If it's already a string, return it
+    if isinstance(description, str):
+        return description
+
+    # Handle Atlassian Document Format (ADF)
+    if isinstance(description, dict):
+        return _parse_adf(description)
+
+    return str(description)
+
+
+def _parse_adf(adf_doc: dict[str, Any]) -> str:
+    """Parse Atlassian Document Format to plain text.
+
+    Args:
+        adf_doc: ADF document structure
+
+    Returns:
+        Plain text extracted from ADF
+    """
+    # Explicit DFS stack: deep ADF documents cost one list pop per node
+    # instead of a Python frame per recursive call. Text goes straight
+    # into a StringIO so large descriptions grow one buffer instead of
+    # a resizing list plus a final join.
+    buf = io.StringIO()
+    # Starts True so an empty document never gets a leading newline
+    last_nl = True
+    stack = [adf_doc]
+
+    while stack:
+        node = stack.pop()
+        node_type = node.get("type", "")
+
+        # Handle text nodes
+        if node_type == "text":
+            text = node.get("text", "")
+            buf.write(text)
+            last_nl = text == "\n"
+
+        # Add line breaks for paragraphs (after their children, below)
+        elif node is _PARAGRAPH_END:
+            if not last_nl:
+                buf.write("\n")
+                last_nl = True
+            continue
+
+        # Handle nodes with content; the sentinel sits under the
+        # reversed children so it pops once they are all processed
+        content = node.get("content")
+        if node_type == "paragraph":
+            stack.append(_PARAGRAPH_END)
+        if content:
+            stack.extend(child for child in reversed(content) if isinstance(child, dict))
+
+    return buf.getvalue().strip()
+
+
+def _extract_links(issue_links: list[dict[str, Any]], ctx: JiraContext) -> list[str]:
+    """Extract related issue links.
+
+    Args:
+        issue_links: List of issue link objects from Jira
+        ctx: Per-run context carrying the precomputed browse prefix
+
+    Returns:
+        List of formatted links (deduplicated, in first-seen order)
+    """
+    # Empty issuelinks is the common case in Jira payloads
+    if not issue_links:
+        return []
+
+    prefix = ctx.browse_prefix
+    seen = set()
+    links = []
+    for link in issue_links:
+        # Handle inward and outward links; the same key can appear on
+        # both sides across link entries, so dedup while formatting
+        for side in ("inwardIssue", "outwardIssue"):
+            linked_issue = link.get(side)
+            if linked_issue:
+                key = linked_issue.get("key")
+                if key and key not in seen:
+                    seen.add(key)
+                    links.append(prefix + key)
+
+    return links
 
-            # Handle text nodes
-            if node_type == "text":
-                text_parts.append(node.get("text", ""))
 
-            # Handle nodes with content
-            content = node.get("content", [])
-            for child in content:
-                if isinstance(child, dict):
-                    extract_text(child)
-
-            # Add line breaks for paragraphs
-            if node_type == "paragraph" and text_parts and text_parts[-1] != "\n":
-                text_parts.append("\n")
-
-        extract_text(adf_doc)
-        return "".join(text_parts).strip()
+class IssueNormalizer:
+    """Backward-compatible facade over the module-level normalize functions.
 
-    @staticmethod
-    def _extract_links(issue_links: list[dict[str, Any]], base_url: str) -> list[str]:
-        """Extract related issue links.
+    The class carried no state — every method was a staticmethod — so the
+    implementations now live at module level where calls skip the class
+    attribute lookup. Existing imports keep working through this alias.
+    """
 
-        Args:
-            issue_links: List of issue link objects from Jira
-            base_url: Jira base URL
-
-        Returns:
-            List of formatted links
-        """
-        links = []
-        for link in issue_links:
-            # Handle inward and outward links
-            inward_issue = link.get("inwardIssue")
-            outward_issue = link.get("outwardIssue")
-
-            if inward_issue:
-                key = inward_issue.get("key")
-                if key:
-                    links.append(f"{base_url.rstrip('/')}/browse/{key}")
-
-            if outward_issue:
-                key = outward_issue.get("key")
-                if key:
-                    links.append(f"{base_url.rstrip('/')}/browse/{key}")
-
-        return links
+    normalize = staticmethod(normalize_issue)
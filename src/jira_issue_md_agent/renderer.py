@@ -6,6 +6,61 @@ from jinja2 import Environment, BaseLoader, TemplateNotFound
 from .models import NormalizedIssue
 
 
+def _render_default(issue: NormalizedIssue) -> str:
+    """Specialized fast path for the packaged issue.md.j2 template.
+
+    The default template is fixed, so rendering it is pure string
+    formatting — no Jinja lexing, node visits, or sandboxed lookups per
+    field. Keep this in sync with templates/issue.md.j2.
+    """
+    # Only computed or reused values are hoisted; the remaining fields
+    # appear once each in the f-string, where locals would be dead stores
+    key = issue.key
+    summary = issue.summary
+    labels = ", ".join(issue.labels)
+    components = ", ".join(issue.components)
+    links = "".join(f"- {link}\n" for link in issue.links)
+    return (
+        f"# {key} — {summary}\n"
+        f"\n"
+        f"- Jira: {issue.url}\n"
+        f"- Project: {issue.project_key}\n"
+        f"- Type: {issue.type}\n"
+        f"- Status: {issue.status}\n"
+        f"- Priority: {issue.priority}\n"
+        f"- Assignee: {issue.assignee}\n"
+        f"- Reporter: {issue.reporter}\n"
+        f"- Labels: {labels}\n"
+        f"- Components: {components}\n"
+        f"- Created: {issue.created_at}\n"
+        f"- Updated: {issue.updated_at}\n"
+        f"\n"
+        f"---\n"
+        f"\n"
+        f"## 背景與需求\n"
+        f"\n"
+        f"{issue.description_text}\n"
+        f"\n"
+        f"---\n"
+        f"\n"
+        f"## 驗收條件 Acceptance Criteria\n"
+        f"\n"
+        f"{issue.acceptance_criteria}\n"
+        f"\n"
+        f"---\n"
+        f"\n"
+        f"## 實作筆記 Dev Notes\n"
+        f"\n"
+        f"{issue.dev_notes}\n"
+        f"\n"
+        f"---\n"
+        f"\n"
+        f"## 參考連結 Links\n"
+        f"\n"
+        f"{links}"
+    )
+
+
 class PackageLoader(BaseLoader):
     """Load templates from package resources using importlib.resources."""
     
@@ -24,8 +79,10 @@ class PackageLoader(BaseLoader):
             source = template_file.read_text(encoding='utf-8')
             
             # Return (source, filename, uptodate_function)
-            # uptodate_function returns False to always reload (safe for packaged apps)
-            return source, None, lambda: False
+            # Packaged templates are immutable at runtime, so report them as
+            # always up to date — Jinja then serves its compiled cache instead
+            # of re-reading and re-parsing the source on every render
+            return source, None, lambda: True
             
         except (FileNotFoundError, AttributeError) as e:
             raise TemplateNotFound(template) from e
@@ -34,6 +91,8 @@ class PackageLoader(BaseLoader):
 class MarkdownRenderer:
     """Render normalized issues to Markdown using Jinja2 templates."""
 
+    DEFAULT_TEMPLATE = "issue.md.j2"
+
     def __init__(self):
         """Initialize renderer with package template loader."""
         self.env = Environment(
@@ -41,10 +100,13 @@ class MarkdownRenderer:
             trim_blocks=True,
             lstrip_blocks=True,
         )
-
-    def render(self, issue: NormalizedIssue, template_name: str = "issue.md.j2") -> str:
+    def render(self, issue: NormalizedIssue, template_name: str = DEFAULT_TEMPLATE) -> str:
         """Render an issue to Markdown.
 
+        The packaged default template renders through a specialized
+        f-string function; other template names go through Jinja (whose
+        environment cache keeps them compiled once).
+
         Args:
             issue: Normalized issue to render
             template_name: Template file name
@@ -52,16 +114,6 @@ class MarkdownRenderer:
         Returns:
             Rendered Markdown content
         """
-        template = self.env.get_template(template_name)
-        return template.render(issue=issue)
-
-    @classmethod
-    def from_package(cls) -> "MarkdownRenderer":
-        """Create renderer using packaged templates.
-
-        Returns:
-            MarkdownRenderer instance
-        """
-        # Get template directory relative to this module
-        template_dir = Path(__file__).parent / "templates"
-        return cls(template_dir)
+        if template_name == self.DEFAULT_TEMPLATE:
+            return _render_default(issue)
+        return self.env.get_template(template_name).render(issue=issue)
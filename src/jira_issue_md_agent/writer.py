@@ -1,13 +1,27 @@
 """File writing and management."""
 
+import asyncio
+import os
 import re
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
+from typing import Iterable, Optional
 
-from rich.console import Console
-
+from ._console import console
 from .models import NormalizedIssue
 
-console = Console()
+# Slugify translation table: whitespace maps to hyphens, invalid Windows
+# filename characters (< > : " / \ | ? *) and control characters are
+# deleted. One str.translate pass replaces the previous regex scans.
+_SLUG_WHITESPACE = (
+    " \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f\x85\xa0\u1680"
+    "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000"
+)
+_SLUG_TABLE: dict[int, Optional[str]] = dict.fromkeys(map(ord, '<>:"/\\|?*'), None)
+_SLUG_TABLE.update(dict.fromkeys(range(0x20), None))
+_SLUG_TABLE[0x7F] = None
+_SLUG_TABLE.update((ord(ch), "-") for ch in _SLUG_WHITESPACE)
 
 
 class MarkdownWriter:
@@ -22,6 +36,9 @@ class MarkdownWriter:
         """
         self.output_dir = Path(output_dir)
         self.overwrite = overwrite
+        # Parents already created this run; most issues in a batch share a
+        # project directory, so this trims mkdir syscalls to one per project
+        self._mkdir_cache: set[Path] = set()
 
     def write(self, issue: NormalizedIssue, content: str) -> Path:
         """Write issue markdown to file.
@@ -33,37 +50,109 @@ class MarkdownWriter:
         Returns:
             Path to written file
         """
+        file_path = self._write_one(issue, content)
+        console.print(f"✓ Written: {file_path}", markup=False, highlight=False)
+        return file_path
+
+    def _write_one(self, issue: NormalizedIssue, content: str) -> Path:
+        """Resolve the target path and write the file (no console output)."""
         file_path = self._get_file_path(issue)
 
         # Handle existing files
         if file_path.exists() and not self.overwrite:
             file_path = self._get_versioned_path(file_path)
 
-        # Ensure directory exists
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write file
-        file_path.write_text(content, encoding="utf-8")
-
-        console.print(f"[green]✓[/green] Written: {file_path}")
+        # Ensure directory exists (duplicate checks from racing writer
+        # threads are harmless given exist_ok=True)
+        parent = file_path.parent
+        if parent not in self._mkdir_cache:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._mkdir_cache.add(parent)
+
+        # Write pre-encoded bytes through a raw fd: one openat/write/close
+        # sequence, no TextIOWrapper or buffered-writer allocation, and
+        # os.write releases the GIL for the batch thread pool
+        data = content.encode("utf-8")
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
         return file_path
 
-    def write_batch(self, issues_with_content: list[tuple[NormalizedIssue, str]]) -> list[Path]:
+    def write_batch(
+        self, issues_with_content: Iterable[tuple[NormalizedIssue, str]]
+    ) -> list[Path]:
         """Write multiple issues to files.
 
+        Accepts any iterable and consumes it once, so callers can stream
+        (issue, content) pairs from a generator without materializing all
+        rendered documents in memory: submission pauses once a bounded
+        window of writes is in flight, so at most that many rendered
+        documents exist at a time. Each write is mkdir + file I/O that
+        releases the GIL, so writes are overlapped through a small thread
+        pool; per-file success prints are left to the caller's summary.
+
         Args:
-            issues_with_content: List of (issue, content) tuples
+            issues_with_content: Iterable of (issue, content) tuples
 
         Returns:
             List of written file paths
         """
-        written_paths = []
-        for issue, content in issues_with_content:
+        written_paths: list[Path] = []
+        in_flight: dict[Future[Path], str] = {}
+
+        def _collect(future: Future[Path]) -> None:
+            key = in_flight.pop(future)
             try:
-                path = self.write(issue, content)
-                written_paths.append(path)
+                written_paths.append(future.result())
             except Exception as e:
-                console.print(f"[red]✗[/red] Failed to write {issue.key}: {e}")
+                console.print(f"✗ Failed to write {key}: {e}", markup=False, highlight=False)
+
+        max_workers = 8
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for issue, content in issues_with_content:
+                in_flight[executor.submit(self._write_one, issue, content)] = issue.key
+                # Twice the workers keeps every thread fed while capping
+                # how many rendered documents sit queued in memory
+                if len(in_flight) >= max_workers * 2:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        _collect(future)
+            for future in as_completed(list(in_flight)):
+                _collect(future)
+
+        return written_paths
+
+    async def write_batch_async(
+        self, issues_with_content: Iterable[tuple[NormalizedIssue, str]]
+    ) -> list[Path]:
+        """Write multiple issues to files from async code.
+
+        Counterpart to write_batch for callers already running an event
+        loop: each write runs in the loop's worker threads via
+        asyncio.to_thread, so the loop stays responsive while the blocking
+        mkdir + file I/O overlaps. Failures are reported per file; paths
+        of successful writes are returned in input order.
+
+        Args:
+            issues_with_content: Iterable of (issue, content) tuples
+
+        Returns:
+            List of written file paths
+        """
+        keys: list[str] = []
+        writes = []
+        for issue, content in issues_with_content:
+            keys.append(issue.key)
+            writes.append(asyncio.to_thread(self._write_one, issue, content))
+
+        written_paths: list[Path] = []
+        for key, result in zip(keys, await asyncio.gather(*writes, return_exceptions=True)):
+            if isinstance(result, BaseException):
+                console.print(f"✗ Failed to write {key}: {result}", markup=False, highlight=False)
+            else:
+                written_paths.append(result)
 
         return written_paths
 
@@ -91,34 +180,31 @@ class MarkdownWriter:
         Returns:
             Slugified text (supports Unicode characters including Chinese)
         """
-        # Remove leading/trailing whitespace
-        slug = text.strip()
-
-        # Replace multiple spaces with single hyphen
-        slug = re.sub(r"\s+", "-", slug)
-
-        # Remove characters that are invalid in Windows filenames
-        # Invalid: < > : " / \ | ? *
-        slug = re.sub(r'[<>:"/\\|?*]', "", slug)
-
-        # Remove control characters
-        slug = re.sub(r"[\x00-\x1f\x7f]", "", slug)
-
-        # Remove multiple consecutive hyphens
-        slug = re.sub(r"-+", "-", slug)
-
-        # Trim hyphens from ends
-        slug = slug.strip("-")
-
-        # Truncate to max length (considering multi-byte characters)
+        # Hyphenate whitespace and drop invalid/control characters in one
+        # C-level table pass
+        translated = text.strip().translate(_SLUG_TABLE)
+
+        # Collapse hyphen runs (and drop leading ones) while recording the
+        # last hyphen that lands inside the length budget, so truncation
+        # below needs no rfind back-scan over the built slug
+        chars: list[str] = []
+        last_hyphen = 0
+        for ch in translated:
+            if ch == "-":
+                if not chars or chars[-1] == "-":
+                    continue
+                if len(chars) < max_length:
+                    last_hyphen = len(chars)
+            chars.append(ch)
+        # Collapsing leaves at most one trailing hyphen to trim
+        if chars and chars[-1] == "-":
+            chars.pop()
+        slug = "".join(chars)
+
+        # Truncate to max length (considering multi-byte characters),
+        # breaking at the recorded hyphen when there is one
         if len(slug) > max_length:
-            # Try to break at hyphen
-            truncated = slug[:max_length]
-            last_hyphen = truncated.rfind("-")
-            if last_hyphen > 0:
-                slug = truncated[:last_hyphen]
-            else:
-                slug = truncated
+            slug = slug[:last_hyphen] if last_hyphen > 0 else slug[:max_length]
 
         return slug or "untitled"
 
@@ -136,9 +222,15 @@ class MarkdownWriter:
         suffix = path.suffix
         parent = path.parent
 
-        version = 2
-        while True:
-            versioned_path = parent / f"{stem}__v{version}{suffix}"
-            if not versioned_path.exists():
-                return versioned_path
-            version += 1
+        # One scandir of the parent instead of a stat per candidate version
+        version_re = re.compile(rf"^{re.escape(stem)}__v(\d+){re.escape(suffix)}$")
+        max_version = 1
+        with os.scandir(parent) as entries:
+            for entry in entries:
+                match = version_re.match(entry.name)
+                if match:
+                    version = int(match.group(1))
+                    if version > max_version:
+                        max_version = version
+
+        return parent / f"{stem}__v{max_version + 1}{suffix}"
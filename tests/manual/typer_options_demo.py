@@ -0,0 +1,14 @@
+"""Manual scratch script for exercising typer options (run directly)."""
+
+if __name__ == "__main__":
+    import typer
+
+    app = typer.Typer()
+
+    @app.command()
+    def test(
+        value: str = typer.Option(..., "--value", "-v"),
+    ):
+        print(f"Got value: {value}")
+
+    app()